@@ -0,0 +1,58 @@
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+
+from src.monitoring.metrics import get_prometheus_metrics, metrics_collector
+from src.utils.logger import setup_logger
+from src.vector_store import get_vector_store
+
+logger = setup_logger(__name__)
+
+
+def create_app() -> FastAPI:
+    """Build the FastAPI application serving alerts, queries and metrics."""
+    app = FastAPI(
+        title="Supply Chain Disruption Predictor",
+        description="Real-time supply chain disruption prediction and alerting",
+        version="1.0.0",
+    )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.get("/")
+    async def root():
+        return {
+            "message": "Supply Chain Disruption Predictor API",
+            "status": "operational",
+        }
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/api/v1/stats")
+    async def stats():
+        return get_vector_store().get_stats()
+
+    @app.get("/api/v1/context")
+    async def context(title: str, description: str = "",
+                      location: str = "", event_type: str = ""):
+        metrics_collector.record_query()
+        return get_vector_store().get_context_for_event({
+            "title": title,
+            "description": description,
+            "location": location,
+            "event_type": event_type,
+        })
+
+    @app.get("/metrics")
+    async def metrics():
+        payload, content_type = get_prometheus_metrics()
+        return Response(content=payload, media_type=content_type)
+
+    return app
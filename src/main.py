@@ -0,0 +1,111 @@
+import argparse
+import importlib.util
+import signal
+import sys
+import threading
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+REQUIRED_PACKAGES = [
+    "pathway",
+    "fastapi",
+    "uvicorn",
+    "sqlalchemy",
+    "numpy",
+    "pandas",
+    "faiss",
+    "sentence_transformers",
+    "openai",
+]
+
+
+def check_dependencies() -> bool:
+    """Verify that all required packages are installed.
+
+    find_spec only consults the import system, so --check answers in
+    milliseconds instead of importing and initializing every heavy
+    package just to see whether it exists.
+    """
+    missing = [
+        package for package in REQUIRED_PACKAGES
+        if importlib.util.find_spec(package) is None
+    ]
+
+    if missing:
+        logger.error(f"Missing required packages: {', '.join(missing)}")
+        return False
+    logger.info("All required packages are installed")
+    return True
+
+
+def setup_database():
+    """Create all database tables."""
+    from src.core.database import Base, engine
+    import src.models.disruption  # noqa: F401 - register models
+
+    Base.metadata.create_all(bind=engine)
+    logger.info("Database tables created")
+
+
+def run_pipeline_only():
+    """Run the streaming pipeline without the API server."""
+    from src.pipeline.pathway_rag_pipeline import PathwayRAGPipeline
+
+    pipeline = PathwayRAGPipeline()
+    pipeline_thread = threading.Thread(target=pipeline.start_streaming, daemon=True)
+    pipeline_thread.start()
+    logger.info("Pipeline started; press Ctrl+C to stop")
+
+    # The old loop called asyncio.sleep(60) without awaiting it, so it
+    # spun at full speed pegging a core. Block on an Event instead and
+    # wake immediately on SIGTERM rather than at the next tick.
+    shutdown = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: shutdown.set())
+    try:
+        shutdown.wait()
+    except KeyboardInterrupt:
+        pass
+    logger.info("Pipeline stopped")
+
+
+def run_api(port: int):
+    """Run the API server (the pipeline runs in a background thread)."""
+    import uvicorn
+
+    from src.api.app import create_app
+    from src.pipeline.pathway_rag_pipeline import PathwayRAGPipeline
+
+    pipeline = PathwayRAGPipeline()
+    pipeline_thread = threading.Thread(target=pipeline.start_streaming, daemon=True)
+    pipeline_thread.start()
+
+    uvicorn.run(create_app(), host="0.0.0.0", port=port)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Supply Chain Disruption Predictor"
+    )
+    parser.add_argument("--port", type=int, default=8001, help="API server port")
+    parser.add_argument("--mode", choices=["api", "pipeline"], default="api")
+    parser.add_argument("--setup-db", action="store_true", help="Create database tables")
+    parser.add_argument("--check", action="store_true", help="Check dependencies and exit")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if check_dependencies() else 1)
+
+    if args.setup_db:
+        setup_database()
+        return
+
+    if args.mode == "pipeline":
+        run_pipeline_only()
+    else:
+        run_api(args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from src.core.database import Base
+
+# JSONB on PostgreSQL gives server-side parsing and GIN indexability;
+# plain JSON is the portable fallback for other dialects (tests run on
+# SQLite).
+_JSON = JSON().with_variant(JSONB(), "postgresql")
+
+
+class DisruptionEvent(Base):
+    __tablename__ = "disruption_events"
+    __table_args__ = (
+        # Dashboard queries filter active disruptions by severity and
+        # order by recency; give them covering composite indexes rather
+        # than sequential scans.
+        Index("ix_active_sev_created", "is_active", "severity", "created_at"),
+        Index("ix_etype_created", "event_type", "created_at"),
+        Index("ix_financial_gin", "financial_impact", postgresql_using="gin"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String(50), nullable=False)
+    severity = Column(String(20), nullable=False)
+    title = Column(String(200), nullable=False)
+    description = Column(Text)
+    location = Column(String(100))
+    latitude = Column(Float)
+    longitude = Column(Float)
+    confidence_score = Column(Float)
+    impact_score = Column(Float)
+    priority_rank = Column(Integer)
+    source = Column(String(50))
+    # Structured details from the impact assessment, stored natively so
+    # reads skip a Python-side json.loads round trip
+    affected_routes = Column(_JSON)
+    mitigation_strategies = Column(_JSON)
+    financial_impact = Column(_JSON)
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
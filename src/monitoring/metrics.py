@@ -0,0 +1,124 @@
+import os
+import threading
+import time
+
+import psutil
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    generate_latest,
+    multiprocess,
+)
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# When uvicorn runs with several workers, per-process registries report
+# diverging counters; prometheus_client's multiprocess mode shares them
+# through mmap files under this directory instead.
+_MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+EVENTS_PROCESSED = Counter(
+    "supplychain_events_processed_total",
+    "Total number of events processed by the pipeline",
+    ["source"],
+)
+DISRUPTIONS_DETECTED = Counter(
+    "supplychain_disruptions_detected_total",
+    "Total number of disruptions detected",
+    ["severity"],
+)
+QUERIES_SERVED = Counter(
+    "supplychain_rag_queries_total",
+    "Total number of RAG queries served",
+)
+SYSTEM_CPU_USAGE = Gauge(
+    "supplychain_system_cpu_percent",
+    "Current system CPU usage percent",
+    multiprocess_mode="livesum",
+)
+SYSTEM_MEMORY_USAGE = Gauge(
+    "supplychain_system_memory_percent",
+    "Current system memory usage percent",
+    multiprocess_mode="livesum",
+)
+VECTOR_STORE_SIZE = Gauge(
+    "supplychain_vector_store_documents",
+    "Number of documents in the vector store",
+    multiprocess_mode="livesum",
+)
+
+
+class MetricsCollector:
+    """Aggregates application and system metrics for Prometheus."""
+
+    def __init__(self):
+        # System gauges are refreshed by a background thread so scrapes
+        # never block; psutil.cpu_percent(interval=1) used to add a full
+        # second to every /metrics request.
+        self._sampler = threading.Thread(
+            target=self._sample_system_metrics, daemon=True
+        )
+        self._sampler.start()
+
+    def _sample_system_metrics(self):
+        # interval=None returns the delta since the previous call, so
+        # each 5 s tick costs microseconds instead of sleeping inline.
+        psutil.cpu_percent(interval=None)
+        while True:
+            time.sleep(5)
+            self.update_system_metrics()
+
+    def record_event(self, source: str):
+        EVENTS_PROCESSED.labels(source=source).inc()
+
+    def record_disruption(self, severity: str):
+        DISRUPTIONS_DETECTED.labels(severity=severity).inc()
+
+    def record_query(self):
+        QUERIES_SERVED.inc()
+
+    def set_vector_store_size(self, size: int):
+        VECTOR_STORE_SIZE.set(size)
+
+    def update_system_metrics(self):
+        """Refresh system-level gauges without blocking the caller."""
+        try:
+            SYSTEM_CPU_USAGE.set(psutil.cpu_percent(interval=None))
+            SYSTEM_MEMORY_USAGE.set(psutil.virtual_memory().percent)
+        except Exception as e:
+            logger.error(f"Error updating system metrics: {e}")
+
+
+metrics_collector = MetricsCollector()
+
+
+# Prometheus scrapes every 15 s in the default config; serving a 1 s
+# stale payload is invisible to it but collapses scrape storms (several
+# scrapers, dashboards hitting /metrics) to one registry walk.
+_payload_cache = [0.0, b""]
+
+
+def get_prometheus_metrics() -> tuple:
+    """Render the metrics exposition payload for the /metrics endpoint.
+
+    System gauges are kept fresh by the collector's sampler thread, so
+    scraping only pays for serialization — and that serialization is
+    itself cached for one second.
+    """
+    now = time.monotonic()
+    if _payload_cache[1] and now - _payload_cache[0] < 1.0:
+        return _payload_cache[1], CONTENT_TYPE_LATEST
+
+    if _MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        payload = generate_latest(registry)
+    else:
+        payload = generate_latest()
+    _payload_cache[0] = now
+    _payload_cache[1] = payload
+    return payload, CONTENT_TYPE_LATEST
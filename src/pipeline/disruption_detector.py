@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class DisruptionDetector:
+    """Keyword-based detector that scores raw events as potential disruptions."""
+
+    def __init__(self):
+        self.supply_chain_keywords = [
+            "supply chain", "logistics", "shipping", "transport", "cargo",
+            "port", "factory", "manufacturing", "warehouse", "distribution",
+            "supplier", "vendor", "procurement", "inventory", "freight",
+        ]
+        self.severity_weights = {"critical": 0.9, "warning": 0.6, "watch": 0.3}
+
+    def detect_disruptions(self, rows: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Score a batch of raw events; None for rows below threshold."""
+        results = []
+        for row in rows:
+            text = f"{row.get('title', '')} {row.get('description', '')}".lower()
+            keyword_matches = sum(
+                1 for keyword in self.supply_chain_keywords if keyword in text
+            )
+            keyword_score = min(keyword_matches / 5.0, 1.0)
+            severity_score = self.severity_weights.get(row.get("severity", "watch"), 0.3)
+            confidence = row.get("confidence_score", 0.5)
+
+            disruption_score = (
+                keyword_score * 0.4 + severity_score * 0.4 + confidence * 0.2
+            )
+
+            if disruption_score < 0.25:
+                results.append(None)
+            else:
+                results.append({
+                    "disruption_score": round(disruption_score, 3),
+                    "keyword_matches": keyword_matches,
+                    "is_disruption": disruption_score >= 0.5,
+                })
+        return results
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from config.settings import settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AIDisruptionDetector:
+    """Uses an LLM to assess supply chain relevance and analyze raw events."""
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        self.api_key = settings.openai_api_key
+        self.api_url = "https://api.openai.com/v1/chat/completions"
+        self.model = "gpt-3.5-turbo"
+        # Injected or lazily created; reusing one pooled session keeps
+        # connections (and TLS handshakes) alive across calls.
+        self._session = session
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the owned HTTP session, if any."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def assess_relevance(self, title: str, description: str, event_type: str) -> float:
+        """Score how relevant an event is to supply chain operations (0-1)."""
+        prompt = (
+            "Rate how relevant the following event is to global supply chain "
+            "operations on a scale from 0.0 to 1.0. Respond with only the number.\n"
+            f"Event type: {event_type}\nTitle: {title}\nDescription: {description}"
+        )
+        try:
+            response = await self._chat(prompt, max_tokens=5)
+            return max(0.0, min(float(response.strip()), 1.0))
+        except Exception as e:
+            logger.error(f"Error assessing relevance: {e}")
+            return 0.5
+
+    async def analyze_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Produce a structured disruption analysis for an event."""
+        prompt = (
+            "Analyze the following event for supply chain impact. Respond with "
+            "a JSON object with keys: disruption_type, affected_sectors (list), "
+            "geographic_scope, disruption_score (0-1), reasoning.\n"
+            f"Title: {event.get('title', '')}\n"
+            f"Description: {event.get('description', '')}\n"
+            f"Location: {event.get('location', '')}\n"
+            f"Event type: {event.get('event_type', '')}"
+        )
+        try:
+            response = await self._chat(prompt, max_tokens=300)
+            return json.loads(response)
+        except Exception as e:
+            logger.error(f"Error analyzing event: {e}")
+            return {
+                "disruption_type": event.get("event_type", "unknown"),
+                "affected_sectors": [],
+                "geographic_scope": "unknown",
+                "disruption_score": 0.5,
+                "reasoning": "AI analysis unavailable",
+            }
+
+    async def generate_insights(self, question: str, context: list) -> str:
+        """Answer a user question grounded in retrieved context documents."""
+        context_block = "\n".join(f"- {doc}" for doc in context)
+        prompt = (
+            "You are a supply chain intelligence assistant. Using only the "
+            "context below, answer the question concisely.\n"
+            f"Context:\n{context_block}\n\nQuestion: {question}"
+        )
+        try:
+            return await self._chat(prompt, max_tokens=400)
+        except Exception as e:
+            logger.error(f"Error generating insights: {e}")
+            return "Insights unavailable."
+
+    async def _chat(self, prompt: str, max_tokens: int = 300) -> str:
+        """Send a single chat completion request to the LLM API."""
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": 0.2,
+        }
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+
+        session = await self._get_session()
+        async with session.post(
+            self.api_url, json=payload, headers=headers,
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+            return data["choices"][0]["message"]["content"]
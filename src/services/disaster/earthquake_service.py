@@ -0,0 +1,317 @@
+import math
+import time
+
+import numpy as np
+import requests
+from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Dict, List, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Module-level constants: the region geometry never changes per
+# instance, so the arrays and the grid index are built once at import.
+
+# Bounding boxes for regions with dense supply chain infrastructure
+_SUPPLY_CHAIN_REGIONS = {
+    "US West Coast": {"min_lat": 32.0, "max_lat": 49.0, "min_lon": -125.0, "max_lon": -114.0},
+    "US East Coast": {"min_lat": 25.0, "max_lat": 45.0, "min_lon": -82.0, "max_lon": -66.0},
+    "East Asia": {"min_lat": 20.0, "max_lat": 46.0, "min_lon": 100.0, "max_lon": 146.0},
+    "Southeast Asia": {"min_lat": -11.0, "max_lat": 20.0, "min_lon": 93.0, "max_lon": 127.0},
+    "Western Europe": {"min_lat": 36.0, "max_lat": 60.0, "min_lon": -10.0, "max_lon": 20.0},
+    "Middle East": {"min_lat": 12.0, "max_lat": 42.0, "min_lon": 32.0, "max_lon": 60.0},
+}
+
+# Bounding boxes as parallel arrays: one vectorized compare classifies
+# a whole batch of quakes instead of a Python loop over regions per
+# quake. Declaration order keeps first-match priority.
+_REGION_NAMES = list(_SUPPLY_CHAIN_REGIONS)
+_REGION_BOUNDS = list(_SUPPLY_CHAIN_REGIONS.values())
+_REGION_MIN_LAT = np.array([b["min_lat"] for b in _REGION_BOUNDS])
+_REGION_MAX_LAT = np.array([b["max_lat"] for b in _REGION_BOUNDS])
+_REGION_MIN_LON = np.array([b["min_lon"] for b in _REGION_BOUNDS])
+_REGION_MAX_LON = np.array([b["max_lon"] for b in _REGION_BOUNDS])
+
+
+def _build_region_grid() -> Dict[tuple, str]:
+    """Index 1-degree grid cells that sit fully inside a region box.
+
+    Single-point lookups become one dict probe; anything not indexed
+    falls back to the exact bbox check, so edge behaviour is unchanged.
+    The first region indexing a cell wins, matching declaration-order
+    priority.
+    """
+    grid: Dict[tuple, str] = {}
+    for name, b in _SUPPLY_CHAIN_REGIONS.items():
+        for lat_cell in range(math.ceil(b["min_lat"]), math.floor(b["max_lat"])):
+            for lon_cell in range(math.ceil(b["min_lon"]), math.floor(b["max_lon"])):
+                grid.setdefault((lat_cell, lon_cell), name)
+    return grid
+
+
+_REGION_GRID = _build_region_grid()
+
+
+class EarthquakeService:
+    """Monitors USGS earthquake feeds for events near supply chain regions."""
+
+    def __init__(self):
+        self.base_url = "https://earthquake.usgs.gov/fdsnws/event/1/query"
+
+        # Pooled session: each poll reuses the TCP/TLS connection to
+        # USGS instead of a fresh handshake, and transient server
+        # errors retry with backoff instead of dropping the cycle.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Bind the shared immutable geometry.
+        self.supply_chain_regions = _SUPPLY_CHAIN_REGIONS
+        self._region_names = _REGION_NAMES
+        self._region_min_lat = _REGION_MIN_LAT
+        self._region_max_lat = _REGION_MAX_LAT
+        self._region_min_lon = _REGION_MIN_LON
+        self._region_max_lon = _REGION_MAX_LON
+        self._region_grid = _REGION_GRID
+
+        # USGS updates the feed roughly once a minute; repeated polls
+        # inside that window reuse the parsed alerts instead of paying
+        # the fetch and GeoJSON parse again.
+        self._cache = None  # (monotonic stamp, min_magnitude, alerts)
+        self._cache_ttl = 60
+        self._last_modified = None
+
+    def get_earthquake_alerts(self, min_magnitude: float = 4.5) -> List[Dict[str, Any]]:
+        """Fetch recent earthquakes and flag those near supply chain regions."""
+        if (self._cache is not None
+                and self._cache[1] == min_magnitude
+                and time.monotonic() - self._cache[0] < self._cache_ttl):
+            return self._cache[2]
+
+        try:
+            # Whole-minute bounds keep the query URL stable within the
+            # TTL window, so upstream HTTP caches can hit too.
+            end_time = datetime.utcnow().replace(second=0, microsecond=0)
+            start_time = end_time - timedelta(days=1)
+
+            params = {
+                "format": "geojson",
+                "starttime": start_time.isoformat(),
+                "endtime": end_time.isoformat(),
+                "minmagnitude": min_magnitude,
+                "orderby": "time-asc",
+            }
+
+            headers = {}
+            if self._last_modified is not None:
+                headers["If-Modified-Since"] = self._last_modified
+            response = self.session.get(
+                self.base_url, params=params, timeout=15, headers=headers
+            )
+            if response.status_code == 304 and self._cache is not None:
+                # Feed unchanged; refresh the cache window and reuse.
+                self._cache = (time.monotonic(), min_magnitude, self._cache[2])
+                return self._cache[2]
+            response.raise_for_status()
+            self._last_modified = response.headers.get("Last-Modified")
+            data = response.json()
+
+            # Keep only the fields the alert needs; referencing the
+            # whole GeoJSON feature would pin the full feed payload in
+            # memory for as long as the alerts are cached.
+            features = []
+            for feature in data.get("features", []):
+                properties = feature.get("properties", {})
+                coordinates = feature.get("geometry", {}).get("coordinates", [])
+                if len(coordinates) >= 2:
+                    features.append((feature.get("id"), properties, coordinates))
+
+            # One batched bbox lookup for the whole feed.
+            lats = np.fromiter(
+                (c[1] for _, _, c in features), dtype=np.float64, count=len(features)
+            )
+            lons = np.fromiter(
+                (c[0] for _, _, c in features), dtype=np.float64, count=len(features)
+            )
+            regions = self._get_affected_regions_batch(lats, lons)
+
+            # Score the whole feed in a handful of vectorized passes;
+            # the Python loop below only runs for quakes that pass the
+            # region/magnitude filter.
+            count = len(features)
+            magnitudes = np.fromiter(
+                (p.get("mag") or 0.0 for _, p, _ in features),
+                dtype=np.float64, count=count,
+            )
+            depths = np.fromiter(
+                (c[2] if len(c) > 2 else 0.0 for _, _, c in features),
+                dtype=np.float64, count=count,
+            )
+            reviewed = np.fromiter(
+                (p.get("status") == "reviewed" for _, p, _ in features),
+                dtype=bool, count=count,
+            )
+            has_region = np.fromiter(
+                (r is not None for r in regions), dtype=bool, count=count,
+            )
+
+            # Only report quakes inside a monitored region, or very large ones
+            keep = has_region | (magnitudes >= 6.0)
+            severities = self._calculate_severity_batch(
+                magnitudes, has_region
+            ).tolist()
+            confidences = self._calculate_confidence_batch(
+                magnitudes, reviewed, depths
+            ).tolist()
+
+            # tolist() hands back plain Python scalars so the alert
+            # dicts stay JSON-serializable downstream.
+            magnitude_list = magnitudes.tolist()
+            depth_list = depths.tolist()
+
+            alerts = []
+            for i in np.flatnonzero(keep).tolist():
+                event_id, properties, coordinates = features[i]
+                magnitude = magnitude_list[i]
+                depth = depth_list[i]
+
+                place = properties.get("place", "Unknown location")
+                title = f"Magnitude {magnitude} earthquake near {place}"
+                description = (
+                    f"A magnitude {magnitude} earthquake occurred near {place} "
+                    f"at a depth of {depth} km."
+                )
+
+                alerts.append({
+                    "source": "earthquake",
+                    "event_type": "earthquake",
+                    "title": title,
+                    "description": description,
+                    "magnitude": magnitude,
+                    "location": place,
+                    "affected_region": regions[i],
+                    "latitude": coordinates[1],
+                    "longitude": coordinates[0],
+                    "depth": depth,
+                    "severity": severities[i],
+                    "confidence_score": confidences[i],
+                    "event_id": event_id,
+                    "detail_url": properties.get("url"),
+                })
+
+            self._cache = (time.monotonic(), min_magnitude, alerts)
+            return alerts
+
+        except Exception as e:
+            logger.error(f"Error fetching earthquake data: {e}")
+            return []
+
+    def _get_affected_regions_batch(self, lats: np.ndarray,
+                                    lons: np.ndarray) -> List[Optional[str]]:
+        """Map coordinate batches to their supply chain regions.
+
+        Evaluates every region for every quake with one boolean mask;
+        argmax picks the first (highest-priority) containing region.
+        """
+        mask = ((lats[:, None] >= self._region_min_lat)
+                & (lats[:, None] <= self._region_max_lat)
+                & (lons[:, None] >= self._region_min_lon)
+                & (lons[:, None] <= self._region_max_lon))
+        hit = mask.any(axis=1)
+        idx = mask.argmax(axis=1)
+        return [
+            self._region_names[i] if h else None
+            for i, h in zip(idx.tolist(), hit.tolist())
+        ]
+
+    def _get_affected_region(self, latitude: float, longitude: float) -> Optional[str]:
+        """Return the supply chain region containing the given point, if any."""
+        region = self._region_grid.get(
+            (math.floor(latitude), math.floor(longitude))
+        )
+        if region is not None:
+            return region
+        # Boundary cells and misses take the exact bounding-box path.
+        return self._get_affected_regions_batch(
+            np.array([latitude]), np.array([longitude])
+        )[0]
+
+    @staticmethod
+    def _calculate_severity_batch(magnitudes: np.ndarray,
+                                  has_region: np.ndarray) -> np.ndarray:
+        """Vectorized counterpart of _calculate_severity.
+
+        np.select evaluates the threshold ladder for every quake at
+        once; condition order mirrors the scalar if/elif chain.
+        """
+        return np.select(
+            [
+                magnitudes >= 7.0,
+                (magnitudes >= 6.0) & has_region,
+                magnitudes >= 6.0,
+                magnitudes >= 5.0,
+            ],
+            ["critical", "critical", "warning", "warning"],
+            default="watch",
+        )
+
+    @staticmethod
+    def _calculate_confidence_batch(magnitudes: np.ndarray,
+                                    reviewed: np.ndarray,
+                                    depths: np.ndarray) -> np.ndarray:
+        """Vectorized counterpart of _calculate_confidence."""
+        confidence = (
+            0.7
+            + 0.2 * (magnitudes >= 6.0)
+            + 0.1 * ((magnitudes >= 5.0) & (magnitudes < 6.0))
+            + 0.1 * reviewed
+            - 0.1 * (depths > 100)
+        )
+        return np.round(np.clip(confidence, 0.1, 1.0), 2)
+
+    @staticmethod
+    def _calculate_severity(magnitude: float, affected_region: Optional[str]) -> str:
+        """Calculate alert severity from magnitude and region exposure."""
+        if magnitude >= 7.0:
+            return "critical"
+        elif magnitude >= 6.0:
+            if affected_region:
+                return "critical"
+            else:
+                return "warning"
+        elif magnitude >= 5.0:
+            return "warning"
+        else:
+            return "watch"
+
+    @staticmethod
+    def _calculate_confidence(properties: Dict[str, Any], depth: float) -> float:
+        """Calculate a confidence score for the earthquake report."""
+        confidence = 0.7
+
+        magnitude = properties.get("mag") or 0.0
+        if magnitude >= 6.0:
+            confidence += 0.2
+        elif magnitude >= 5.0:
+            confidence += 0.1
+
+        if properties.get("status") == "reviewed":
+            confidence += 0.1
+
+        # Very deep quakes cause less surface disruption
+        if depth > 100:
+            confidence -= 0.1
+
+        return round(max(0.1, min(confidence, 1.0)), 2)
@@ -0,0 +1,166 @@
+import asyncio
+import re
+from typing import Any, Dict, List
+
+import httpx
+
+from config.settings import settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Module-level constants: this data never changes per instance, so it
+# is built once at import instead of per WeatherService().
+
+# Major ports and logistics hubs to monitor
+_KEY_LOCATIONS = (
+    {"name": "Los Angeles", "lat": 34.0522, "lon": -118.2437},
+    {"name": "Long Beach", "lat": 33.7701, "lon": -118.1937},
+    {"name": "New York", "lat": 40.7128, "lon": -74.0060},
+    {"name": "Savannah", "lat": 32.0809, "lon": -81.0912},
+    {"name": "Shanghai", "lat": 31.2304, "lon": 121.4737},
+    {"name": "Shenzhen", "lat": 22.5431, "lon": 114.0579},
+    {"name": "Singapore", "lat": 1.3521, "lon": 103.8198},
+    {"name": "Rotterdam", "lat": 51.9244, "lon": 4.4777},
+    {"name": "Hamburg", "lat": 53.5511, "lon": 9.9937},
+)
+
+_SEVERE_CONDITIONS = (
+    "thunderstorm", "tornado", "hurricane", "typhoon", "cyclone",
+    "blizzard", "ice storm", "flood", "squall", "heavy snow",
+)
+_CRITICAL_CONDITIONS = (
+    "tornado", "hurricane", "typhoon", "cyclone", "blizzard",
+)
+_WARNING_CONDITIONS = (
+    "thunderstorm", "flood", "ice storm", "heavy snow", "squall",
+)
+
+# One compiled alternation per tier: classifying a condition is a
+# single scan instead of a substring test per keyword.
+_SEVERE_RE = re.compile("|".join(map(re.escape, _SEVERE_CONDITIONS)), re.IGNORECASE)
+_CRITICAL_RE = re.compile("|".join(map(re.escape, _CRITICAL_CONDITIONS)), re.IGNORECASE)
+_WARNING_RE = re.compile("|".join(map(re.escape, _WARNING_CONDITIONS)), re.IGNORECASE)
+
+
+class WeatherService:
+    """Fetches severe weather conditions for major supply chain hubs."""
+
+    def __init__(self):
+        self.api_key = settings.openweather_api_key
+        self.base_url = "http://api.openweathermap.org/data/2.5"
+        self._client = None
+        self._client_loop = None
+
+        # Bind the shared immutable tables.
+        self.key_locations = _KEY_LOCATIONS
+        self.severe_conditions = _SEVERE_CONDITIONS
+        self.critical_conditions = _CRITICAL_CONDITIONS
+        self.warning_conditions = _WARNING_CONDITIONS
+        self._severe_re = _SEVERE_RE
+        self._critical_re = _CRITICAL_RE
+        self._warning_re = _WARNING_RE
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return a pooled HTTP/2 client bound to the running event loop.
+
+        With HTTP/2 all location requests multiplex over a single
+        connection, so a poll cycle costs one TLS handshake instead of
+        one per location.
+        """
+        loop = asyncio.get_running_loop()
+        if (self._client is None or self._client.is_closed
+                or self._client_loop is not loop):
+            if self._client is not None and not self._client.is_closed:
+                # The previous loop is gone; close the abandoned client
+                # so its keep-alive connections are released instead of
+                # leaking one pool per poll cycle.
+                try:
+                    await self._client.aclose()
+                except Exception as e:
+                    logger.warning(f"Error closing stale weather client: {e}")
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                timeout=10.0,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def close(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def _fetch_location(self, client: httpx.AsyncClient,
+                              location: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch and filter severe-weather alerts for one location."""
+        params = {
+            "lat": location["lat"],
+            "lon": location["lon"],
+            "appid": self.api_key,
+            "units": "metric",
+        }
+        response = await client.get(f"{self.base_url}/weather", params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        alerts = []
+        for condition in data.get("weather", []):
+            if self._is_severe_weather(condition):
+                alerts.append({
+                    "source": "weather",
+                    "event_type": "weather",
+                    "title": f"{condition.get('main', 'Severe Weather')} at {location['name']}",
+                    "description": condition.get("description", ""),
+                    "severity": self._map_weather_severity(condition),
+                    "location": location["name"],
+                    "latitude": location["lat"],
+                    "longitude": location["lon"],
+                    "wind_speed": data.get("wind", {}).get("speed", 0.0),
+                })
+        return alerts
+
+    async def get_weather_alerts_async(self) -> List[Dict[str, Any]]:
+        """Fetch weather alerts for all monitored locations concurrently.
+
+        All location requests multiplex over one HTTP/2 connection and
+        run in parallel, so a poll costs roughly one round trip instead
+        of nine.
+        """
+        client = await self._get_client()
+        results = await asyncio.gather(
+            *(self._fetch_location(client, location)
+              for location in self.key_locations),
+            return_exceptions=True,
+        )
+
+        alerts = []
+        for location, result in zip(self.key_locations, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Error fetching weather data for {location['name']}: {result}"
+                )
+                continue
+            alerts.extend(result)
+        return alerts
+
+    def get_weather_alerts(self) -> List[Dict[str, Any]]:
+        """Synchronous shim around the concurrent fetch."""
+        return asyncio.run(self.get_weather_alerts_async())
+
+    def _is_severe_weather(self, condition: Dict[str, Any]) -> bool:
+        """Check whether a weather condition is severe enough to report."""
+        text = f"{condition.get('main', '')} {condition.get('description', '')}"
+        return self._severe_re.search(text) is not None
+
+    def _map_weather_severity(self, condition: Dict[str, Any]) -> str:
+        """Map a weather condition to an alert severity level."""
+        text = f"{condition.get('main', '')} {condition.get('description', '')}"
+
+        if self._critical_re.search(text):
+            return "critical"
+        elif self._warning_re.search(text):
+            return "warning"
+        else:
+            return "watch"
@@ -0,0 +1,17 @@
+import time
+from datetime import datetime
+
+# Cached ISO timestamp shared by the streaming hot paths. Formatting a
+# datetime costs far more than the 10ms resolution any event timestamp
+# needs, so refresh the string at most once per 10ms.
+_TS_REFRESH_NS = 10_000_000
+_ts_cache = ["", 0]
+
+
+def now_iso() -> str:
+    """Return the current UTC time in ISO format, cached for ~10ms."""
+    t = time.monotonic_ns()
+    if t - _ts_cache[1] > _TS_REFRESH_NS:
+        _ts_cache[0] = datetime.utcnow().isoformat()
+        _ts_cache[1] = t
+    return _ts_cache[0]
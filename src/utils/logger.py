@@ -0,0 +1,18 @@
+import logging
+import sys
+
+
+def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
+    """Create a console logger shared across the application."""
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, level.upper()))
+
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+    return logger
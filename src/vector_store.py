@@ -0,0 +1,501 @@
+import hashlib
+import os
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List
+
+import faiss
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from sentence_transformers import SentenceTransformer
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# faiss-cpu >= 1.8 dispatches to the widest SIMD build (AVX2/AVX-512)
+# at load time; log what this host got so a scalar fallback is visible
+# in production logs instead of silently costing search throughput.
+try:
+    logger.info(
+        f"FAISS instruction sets: {sorted(faiss.supported_instruction_sets())}"
+    )
+except AttributeError:
+    logger.info("FAISS build does not expose supported_instruction_sets")
+
+# index.search releases the GIL and OMP-parallelizes across the rows of
+# a batched query matrix; give it every core so search_batch saturates
+# the host instead of running single-threaded.
+faiss.omp_set_num_threads(os.cpu_count() or 1)
+
+
+# Document type -> context bucket; one hash lookup per hit instead of
+# four substring scans.
+_TYPE_BUCKET = {
+    "port_info": "location_insights",
+    "waterway_info": "location_insights",
+    "sector_info": "sector_insights",
+    "agriculture_info": "sector_insights",
+    "pattern": "historical_patterns",
+    "weather": "historical_patterns",
+}
+
+
+class _OnnxEncoder:
+    """MiniLM encoder on ONNX Runtime with the same encode() surface.
+
+    Dynamic int8 quantization makes CPU inference several times faster
+    than the PyTorch path for this model size.
+    """
+
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        # Export + dynamic int8 quantization is deterministic for a
+        # given model, so the quantized graph is cached on disk and
+        # reused across restarts instead of re-quantizing per process.
+        quant_dir = os.path.join(
+            os.path.expanduser("~/.cache/supplychain"),
+            f"onnx-int8-{model_name.rsplit('/', 1)[-1]}",
+        )
+        if not os.path.exists(os.path.join(quant_dir, "model_quantized.onnx")):
+            exported = ORTModelForFeatureExtraction.from_pretrained(
+                model_name, export=True
+            )
+            quantizer = ORTQuantizer.from_pretrained(exported)
+            quantizer.quantize(
+                save_dir=quant_dir,
+                quantization_config=AutoQuantizationConfig.avx2(
+                    is_static=False, per_channel=False
+                ),
+            )
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            quant_dir, file_name="model_quantized.onnx"
+        )
+
+    def encode(self, texts: List[str], batch_size: int = 32,
+               normalize_embeddings: bool = True, **_: Any) -> np.ndarray:
+        """Encode texts to (optionally normalized) float32 embeddings.
+
+        Texts are processed in length order (smart batching) so each
+        padded batch wastes as little compute as possible, then results
+        are restored to input order.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        ordered_texts = [texts[i] for i in order]
+
+        outputs = []
+        for start in range(0, len(ordered_texts), batch_size):
+            enc = self.tokenizer(
+                ordered_texts[start:start + batch_size], padding=True,
+                truncation=True, max_length=256, return_tensors="np",
+            )
+            hidden = self.model(**enc).last_hidden_state
+            mask = enc["attention_mask"][:, :, None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(
+                mask.sum(axis=1), 1e-9
+            )
+            outputs.append(pooled)
+        ordered = np.concatenate(outputs)
+        embeddings = np.empty_like(ordered)
+        embeddings[order] = ordered
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if normalize_embeddings:
+            faiss.normalize_L2(embeddings)
+        return embeddings
+
+
+def _load_encoder():
+    """Prefer the ONNX Runtime encoder, falling back to PyTorch SBERT."""
+    try:
+        encoder = _OnnxEncoder()
+        logger.info("Using ONNX Runtime embedding encoder")
+        return encoder
+    except Exception as e:
+        logger.info(f"ONNX encoder unavailable ({e}); using SentenceTransformer")
+        return _load_torch_encoder()
+
+
+def _load_torch_encoder():
+    """Build the SBERT fallback, specialized for short fixed shapes."""
+    import torch
+
+    # intra-op threading is off by default in some builds; MiniLM on CPU
+    # scales near-linearly with cores for these batch sizes.
+    torch.set_num_threads(os.cpu_count() or 1)
+
+    model = SentenceTransformer('all-MiniLM-L6-v2')
+    # Event titles and queries are short and bounded; a fixed max length
+    # plus dynamic=False lets torch.compile specialize one graph instead
+    # of re-dispatching on every new shape.
+    model.max_seq_length = 128
+    try:
+        transformer = model._modules['0']
+        transformer.auto_model = torch.compile(
+            transformer.auto_model, mode='reduce-overhead', dynamic=False
+        )
+    except Exception as e:
+        logger.info(f"torch.compile unavailable ({e}); using eager encoder")
+    return model
+
+
+class SupplyChainVectorStore:
+    """FAISS-backed knowledge base for supply chain context retrieval."""
+
+    def __init__(self, dimension: int = 384, index_type: str = "hnsw"):
+        self.dimension = dimension
+        self._embedding_model = None
+        if index_type == "hnsw":
+            # Historical disruptions keep appending; a graph index keeps
+            # search sub-linear instead of brute-forcing every vector.
+            # fp16 scalar-quantized storage halves per-vector memory and
+            # bandwidth with no data-dependent training - int8 would
+            # learn its per-dimension ranges from the tiny seed batch
+            # and clip everything added later.
+            self.index = faiss.IndexHNSWSQ(
+                dimension, faiss.ScalarQuantizer.QT_fp16, 32,
+                faiss.METRIC_INNER_PRODUCT,
+            )
+            self.index.hnsw.efConstruction = 40
+            self.index.hnsw.efSearch = 64
+        else:
+            self.index = faiss.IndexScalarQuantizer(
+                dimension, faiss.ScalarQuantizer.QT_fp16,
+                faiss.METRIC_INNER_PRODUCT,
+            )
+        self.documents: List[str] = []
+        self.metadata: List[Dict[str, Any]] = []
+
+        # Document types interned to small integer codes; stats become
+        # one np.bincount instead of a Python dict-counting loop.
+        self._type_vocab: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self._type_codes: List[int] = []
+
+        # Raw vectors kept as one contiguous float32 matrix (grown
+        # geometrically) so the index can be rebuilt or retrained with
+        # a single add instead of re-embedding every document.
+        self._vectors = np.empty((256, dimension), dtype=np.float32)
+        self._vector_count = 0
+
+        # The same event text is embedded for both context retrieval
+        # and historical lookup; cache query embeddings as bytes.
+        self._encode_query = lru_cache(maxsize=1024)(self._encode_query_uncached)
+
+        # Re-processed events (dedup retries, historical + current path)
+        # rebuild identical context; cache whole results and key them on
+        # an epoch that bumps whenever documents are added.
+        self._context_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+        self._cache_epoch = 0
+
+        self._initialize_knowledge_base()
+
+    @property
+    def embedding_model(self):
+        """Encoder handle, loaded on first use rather than at construction."""
+        if self._embedding_model is None:
+            self._embedding_model = _load_encoder()
+        return self._embedding_model
+
+    def _initialize_knowledge_base(self):
+        """Seed the store with static supply chain domain knowledge."""
+        knowledge_docs = [
+            {"content": "The Port of Shanghai is the world's busiest container port, handling over 47 million TEU annually. Disruptions here affect electronics, machinery, and textile exports globally.",
+             "metadata": {"type": "port_info", "location": "Shanghai", "importance": "critical"}},
+            {"content": "The Port of Singapore is a major transshipment hub connecting Asia-Pacific trade routes. It handles about 37 million TEU and one fifth of the world's shipping containers.",
+             "metadata": {"type": "port_info", "location": "Singapore", "importance": "critical"}},
+            {"content": "The Ports of Los Angeles and Long Beach together handle about 40% of US container imports, primarily from Asia. Congestion here delays retail and manufacturing supply across North America.",
+             "metadata": {"type": "port_info", "location": "Los Angeles", "importance": "critical"}},
+            {"content": "The Port of Rotterdam is Europe's largest seaport and the main gateway for goods entering the European market, with strong petrochemical and agri-bulk flows.",
+             "metadata": {"type": "port_info", "location": "Rotterdam", "importance": "high"}},
+            {"content": "The Suez Canal carries roughly 12% of global trade. A blockage, as in the 2021 Ever Given incident, can delay hundreds of vessels and cost billions per week.",
+             "metadata": {"type": "waterway_info", "location": "Suez Canal", "importance": "critical"}},
+            {"content": "The Panama Canal connects Atlantic and Pacific trade. Drought-induced draft restrictions reduce transit capacity and force rerouting around Cape Horn.",
+             "metadata": {"type": "waterway_info", "location": "Panama Canal", "importance": "critical"}},
+            {"content": "Semiconductor manufacturing is concentrated in Taiwan, South Korea, and China. Disruptions cascade into automotive, consumer electronics, and industrial equipment within weeks.",
+             "metadata": {"type": "sector_info", "location": "East Asia", "importance": "critical"}},
+            {"content": "Automotive supply chains rely on just-in-time delivery of thousands of components. Even short disruptions at tier-2 suppliers can halt assembly lines.",
+             "metadata": {"type": "sector_info", "location": "Global", "importance": "high"}},
+            {"content": "Grain exports from the Black Sea region supply much of the Middle East and North Africa. Conflict or port closures there drive global food price volatility.",
+             "metadata": {"type": "agriculture_info", "location": "Black Sea", "importance": "high"}},
+            {"content": "Historically, typhoons in the South China Sea close major Chinese ports for 2-5 days, creating vessel backlogs that take 1-2 weeks to clear.",
+             "metadata": {"type": "pattern", "location": "East Asia", "importance": "medium"}},
+        ]
+
+        # The seed docs are static, so their embeddings are cached on
+        # disk keyed by content hash; a process restart loads them back
+        # instead of re-encoding the same texts.
+        cache_key = hashlib.sha256(
+            orjson.dumps(knowledge_docs, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()[:16]
+        cache_path = os.path.join(
+            os.path.expanduser("~/.cache/supplychain"), f"kb_{cache_key}"
+        )
+        if os.path.exists(f"{cache_path}.npy") and self.load_index(cache_path):
+            logger.info("Initialized knowledge base from embedding cache")
+            return
+
+        self.add_documents(
+            [doc["content"] for doc in knowledge_docs],
+            [doc["metadata"] for doc in knowledge_docs],
+        )
+        self.save_index(cache_path)
+
+        logger.info(f"Initialized knowledge base with {len(knowledge_docs)} documents")
+
+    def add_documents(self, texts: List[str], metadatas: List[Dict[str, Any]]):
+        """Embed a batch of documents with one encode and one index add."""
+        if not texts:
+            return
+        embeddings = self.embedding_model.encode(
+            texts, batch_size=32, convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False,
+        )
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if not self.index.is_trained:
+            # QT_fp16 has no data-dependent parameters; train is a
+            # cheap formality that just flips the trained flag.
+            self.index.train(embeddings)
+        self.index.add(embeddings)
+        self._append_vectors(embeddings)
+        added_at = datetime.utcnow().isoformat()
+        self.documents.extend(texts)
+        self.metadata.extend(
+            {**metadata, "added_at": added_at} for metadata in metadatas
+        )
+        for metadata in metadatas:
+            self._type_codes.append(self._intern_type(metadata.get("type", "unknown")))
+        self._cache_epoch += 1
+
+    def _intern_type(self, doc_type: str) -> int:
+        """Map a document type to its stable integer code."""
+        code = self._type_vocab.get(doc_type)
+        if code is None:
+            code = len(self._type_names)
+            self._type_vocab[doc_type] = code
+            self._type_names.append(doc_type)
+        return code
+
+    def add_document(self, text: str, metadata: Dict[str, Any]):
+        """Embed a document and add it to the index."""
+        self.add_documents([text], [metadata])
+
+    def _append_vectors(self, embeddings: np.ndarray):
+        """Append rows to the raw vector matrix, growing geometrically."""
+        needed = self._vector_count + len(embeddings)
+        if needed > len(self._vectors):
+            capacity = len(self._vectors) or 256
+            while capacity < needed:
+                capacity *= 2
+            grown = np.empty((capacity, self.dimension), dtype=np.float32)
+            grown[:self._vector_count] = self._vectors[:self._vector_count]
+            self._vectors = grown
+        self._vectors[self._vector_count:needed] = embeddings
+        self._vector_count = needed
+
+    def _encode_query_uncached(self, query: str) -> bytes:
+        """Encode and normalize a query, returned as immutable bytes."""
+        embedding = self.embedding_model.encode(
+            [query], convert_to_numpy=True, normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return np.ascontiguousarray(embedding, dtype=np.float32).tobytes()
+
+    def search(self, query: str, k: int = 5, threshold: float = 0.3) -> List[Dict[str, Any]]:
+        """Search for documents similar to the query."""
+        if self.index.ntotal == 0:
+            return []
+
+        query_embedding = np.frombuffer(
+            self._encode_query(query), dtype=np.float32
+        ).reshape(1, -1)
+
+        k = min(k, self.index.ntotal)
+        scores, indices = self.index.search(query_embedding, k)
+        return self._collect_results(scores[0], indices[0], threshold)
+
+    def _collect_results(self, scores: np.ndarray, indices: np.ndarray,
+                         threshold: float) -> List[Dict[str, Any]]:
+        """Turn one row of FAISS output into result dicts.
+
+        Threshold and bounds checks run as one vectorized mask instead
+        of a Python comparison per hit.
+        """
+        mask = (scores >= threshold) & (indices >= 0) & (indices < len(self.documents))
+        results = []
+        for rank, j in enumerate(np.nonzero(mask)[0], start=1):
+            idx = indices[j]
+            results.append({
+                "document": self.documents[idx],
+                "metadata": self.metadata[idx],
+                "score": float(scores[j]),
+                "rank": rank,
+            })
+        return results
+
+    def search_batch(self, queries: List[str], k: int = 5,
+                     threshold: float = 0.3) -> List[List[Dict[str, Any]]]:
+        """Search several queries with one encode and one index call."""
+        if not queries or self.index.ntotal == 0:
+            return [[] for _ in queries]
+
+        embeddings = self.embedding_model.encode(
+            queries, batch_size=32, convert_to_numpy=True,
+            normalize_embeddings=True, show_progress_bar=False,
+        )
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        k = min(k, self.index.ntotal)
+        scores, indices = self.index.search(embeddings, k)
+        return [
+            self._collect_results(row_scores, row_indices, threshold)
+            for row_scores, row_indices in zip(scores, indices)
+        ]
+
+    def get_context_for_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Retrieve knowledge base context relevant to a disruption event."""
+        query = (
+            f"{event.get('title', '')} {event.get('description', '')} "
+            f"{event.get('location', '')} {event.get('event_type', '')}"
+        )
+        cache_key = (self._cache_epoch, query)
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        results = self.search(query, k=10)
+
+        context = {
+            "location_insights": [],
+            "sector_insights": [],
+            "historical_patterns": [],
+        }
+        for result in results:
+            bucket = _TYPE_BUCKET.get(result["metadata"].get("type", ""))
+            if bucket is not None:
+                context[bucket].append(result["document"])
+
+        self._context_cache[cache_key] = context
+        return context
+
+    def get_similar_historical_events(self, event: Dict[str, Any], k: int = 3) -> List[Dict[str, Any]]:
+        """Find past disruption events similar to the given one."""
+        query = f"{event.get('title', '')} {event.get('description', '')}"
+        results = self.search(query, k=k * 3)
+
+        historical = []
+        for result in results:
+            if result["metadata"].get("type") == "disruption_event":
+                historical.append(result)
+            if len(historical) >= k:
+                break
+
+        return historical
+
+    def add_disruption_event(self, event_data: Dict[str, Any]):
+        """Store a processed disruption event for future retrieval."""
+        doc_text = (
+            f"{event_data.get('title', '')}: {event_data.get('description', '')} "
+            f"Location: {event_data.get('location', '')}. "
+            f"Severity: {event_data.get('severity', '')}."
+        )
+        metadata = {
+            "type": "disruption_event",
+            "location": event_data.get("location", ""),
+            "severity": event_data.get("severity", ""),
+            "event_type": event_data.get("event_type", ""),
+            "importance": "high" if event_data.get("severity") == "critical" else "medium",
+        }
+        self.add_document(doc_text, metadata)
+
+    def save_index(self, filepath: str):
+        """Persist the raw vectors and document store to disk."""
+        try:
+            os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+            np.save(f"{filepath}.npy", self._vectors[:self._vector_count])
+            with open(f"{filepath}.json", "wb") as f:
+                f.write(orjson.dumps({
+                    "documents": self.documents,
+                    "metadata": self.metadata,
+                    "dimension": self.dimension,
+                }))
+            logger.info(f"Saved vector store to {filepath}")
+        except Exception as e:
+            logger.error(f"Error saving vector store: {e}")
+
+    def load_index(self, filepath: str) -> bool:
+        """Load a saved store and rebuild the index from raw vectors."""
+        try:
+            # mmap keeps the saved matrix in the OS page cache, shared
+            # across uvicorn workers, instead of a private copy per
+            # process; the first append after load copies it out into a
+            # writable buffer via the usual growth path.
+            vectors = np.load(f"{filepath}.npy", mmap_mode="r")
+            with open(f"{filepath}.json", "rb") as f:
+                data = orjson.loads(f.read())
+            self.documents = data["documents"]
+            self.metadata = data["metadata"]
+            self.dimension = data["dimension"]
+            self._type_codes = [
+                self._intern_type(meta.get("type", "unknown"))
+                for meta in self.metadata
+            ]
+
+            # Rebuilding from the saved matrix is one train+add pass, so
+            # the configured index type applies regardless of what was
+            # running when the store was saved.
+            self.index.reset()
+            self._vectors = vectors
+            self._vector_count = len(vectors)
+            if len(vectors):
+                # Transient contiguous copy for FAISS; the index keeps
+                # its own (quantized) storage, so this is freed after.
+                data = np.ascontiguousarray(vectors, dtype=np.float32)
+                if not self.index.is_trained:
+                    self.index.train(data)
+                self.index.add(data)
+            logger.info(f"Loaded vector store from {filepath}")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading vector store: {e}")
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return summary statistics about the store."""
+        return {
+            "total_documents": len(self.documents),
+            "index_size": self.index.ntotal,
+            "dimension": self.dimension,
+            "document_types": self._get_document_type_counts(),
+        }
+
+    def _get_document_type_counts(self) -> Dict[str, int]:
+        """Count stored documents by metadata type."""
+        if not self._type_codes:
+            return {}
+        counts = np.bincount(
+            np.asarray(self._type_codes, dtype=np.int64),
+            minlength=len(self._type_names),
+        )
+        return {
+            name: int(count)
+            for name, count in zip(self._type_names, counts) if count
+        }
+
+
+# Created on first use: importing this module (e.g. from `main.py --check`
+# or `--setup-db`) must not pay for model download plus seed embedding.
+_vector_store = None
+
+
+def get_vector_store() -> SupplyChainVectorStore:
+    """Return the process-wide vector store, creating it on first access."""
+    global _vector_store
+    if _vector_store is None:
+        _vector_store = SupplyChainVectorStore()
+    return _vector_store
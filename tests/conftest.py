@@ -0,0 +1,256 @@
+import asyncio
+import importlib.util
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+# uvloop event loops are markedly faster on socket-heavy async tests;
+# installing the policy here makes pytest-asyncio's per-test loops use
+# it without any per-fixture plumbing.
+if importlib.util.find_spec("uvloop") is not None:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Computed once at collection; the mocks only need a plausible
+# timestamp, not a fresh one per test.
+_NOW_ISO = datetime.now().isoformat()
+_NOW_MS = int(datetime.now().timestamp() * 1000)
+
+
+@pytest.fixture(scope="session")
+def test_db():
+    """Provide a session factory bound to a throwaway in-memory database.
+
+    StaticPool hands every connection the same in-memory SQLite, so
+    schema setup and queries never touch disk and parallel workers do
+    not contend on a shared test.db file.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    import src.core.database as database
+    from src.core.database import Base
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    # Point module-level consumers at the test engine for the session.
+    # Modules like the pipeline do `from src.core.database import
+    # SessionLocal` at import time and hold their own reference, so the
+    # sessionmaker is rebound both on the database module and on any
+    # already-imported consumer.
+    original_engine = database.engine
+    original_sessionmaker = database.SessionLocal
+    database.engine = engine
+    database.SessionLocal = TestSession
+    pipeline_module = sys.modules.get("src.pipeline.pathway_rag_pipeline")
+    if pipeline_module is not None:
+        pipeline_module.SessionLocal = TestSession
+
+    yield TestSession
+
+    database.engine = original_engine
+    database.SessionLocal = original_sessionmaker
+    if pipeline_module is not None:
+        pipeline_module.SessionLocal = original_sessionmaker
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def reset_environment(monkeypatch):
+    """Keep API keys deterministic and harmless during tests."""
+    monkeypatch.setenv("OPENWEATHER_API_KEY", "test-key")
+    monkeypatch.setenv("NEWS_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+def _temp_tree(names):
+    """Yield a fresh temp dir with the given subdirectories.
+
+    The temp dir is brand new, so plain mkdir suffices — no exist_ok
+    stat or makedirs parent walk per entry.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for name in names:
+            (root / name).mkdir()
+        yield temp_dir
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Temporary directory tree mirroring the stream staging layout."""
+    yield from _temp_tree(("weather", "news", "earthquake", "manual_updates"))
+
+
+# The mock graphs below are read-only: tests inspect calls and consume
+# the canned return values but never reconfigure them. Building each
+# graph (and its patcher, where there is one) once per session and
+# handing tests a reset view keeps per-test overhead to a reset_mock().
+
+
+@pytest.fixture(scope="session")
+def _session_sentence_transformer():
+    # Patch the names the stores bound at import time; patching the
+    # sentence_transformers package attribute would never reach modules
+    # that already did `from sentence_transformers import ...`.
+    mock_model = MagicMock()
+    # Shaped like the real encoder's output: one normalized-ish float32
+    # row per input text, so store code can .astype and index it.
+    mock_model.encode.side_effect = lambda texts, **kwargs: np.full(
+        (len(texts), 384), 0.1, dtype="float32"
+    )
+    with patch("src.vector_store.SentenceTransformer",
+               return_value=mock_model), \
+            patch("src.pipeline.real_time_vector_store.SentenceTransformer",
+                  return_value=mock_model):
+        yield mock_model
+
+
+@pytest.fixture
+def mock_sentence_transformer(_session_sentence_transformer):
+    """Patch the stores' SentenceTransformer with a deterministic fake."""
+    _session_sentence_transformer.reset_mock()
+    return _session_sentence_transformer
+
+
+@pytest.fixture(scope="session")
+def _session_faiss_index():
+    # Both stores construct their index through the faiss module
+    # attribute - quantized HNSW, or flat scalar quantizer fallback -
+    # so patching those constructors covers every code path.
+    mock_index = MagicMock()
+    mock_index.ntotal = 0
+    mock_index.search.return_value = ([[0.9]], [[0]])
+    with patch("faiss.IndexHNSWSQ", return_value=mock_index), \
+            patch("faiss.IndexScalarQuantizer", return_value=mock_index):
+        yield mock_index
+
+
+@pytest.fixture
+def mock_faiss_index(_session_faiss_index):
+    """Patch the FAISS index constructors with an in-memory fake."""
+    _session_faiss_index.reset_mock()
+    return _session_faiss_index
+
+
+@pytest.fixture(scope="session")
+def _session_vector_store():
+    store = MagicMock()
+    store.search_real_time.return_value = [{
+        "content": "Test document",
+        "metadata": {"type": "port_info", "added_ms": _NOW_MS},
+        "score": 0.9,
+        "freshness": "live",
+    }]
+    store.get_current_size.return_value = 10
+    store.get_real_time_stats.return_value = {
+        "total_documents": 10,
+        "index_size": 10,
+        "recent_updates_count": 2,
+        "latest_alerts_count": 1,
+        "timestamp": _NOW_ISO,
+    }
+    return store
+
+
+@pytest.fixture
+def mock_vector_store(_session_vector_store):
+    """A mock real-time vector store with plausible return values."""
+    _session_vector_store.reset_mock()
+    return _session_vector_store
+
+
+@pytest.fixture(scope="session")
+def _session_ai_service():
+    # The real detector's methods are coroutines; AsyncMock keeps
+    # `await service.analyze_event(...)` working in tests.
+    service = MagicMock()
+    service.assess_relevance = AsyncMock(return_value=0.8)
+    service.analyze_event = AsyncMock(return_value={
+        "disruption_type": "weather",
+        "affected_sectors": ["shipping"],
+        "geographic_scope": "regional",
+        "disruption_score": 0.7,
+        "reasoning": "test",
+    })
+    service.generate_insights = AsyncMock(return_value="Mock insights")
+    return service
+
+
+@pytest.fixture
+def mock_ai_service(_session_ai_service):
+    """A mock AI detector that never performs network calls."""
+    _session_ai_service.reset_mock()
+    return _session_ai_service
+
+
+@pytest.fixture(scope="session")
+def _session_pathway_pipeline(_session_vector_store, _session_ai_service):
+    pipeline = MagicMock()
+    pipeline.vector_store = _session_vector_store
+    pipeline.ai_detector = _session_ai_service
+    pipeline.health_check = MagicMock(return_value={
+        "status": "healthy",
+        "timestamp": _NOW_ISO,
+    })
+    return pipeline
+
+
+@pytest.fixture
+def mock_pathway_pipeline(_session_pathway_pipeline):
+    """A mock streaming pipeline wired to the mock store and AI service."""
+    _session_pathway_pipeline.reset_mock()
+    return _session_pathway_pipeline
+
+
+@pytest.fixture
+def sample_weather_alert():
+    return {
+        "source": "weather",
+        "event_type": "weather",
+        "title": "Thunderstorm at Shanghai",
+        "description": "heavy thunderstorm with strong winds",
+        "severity": "warning",
+        "location": "Shanghai",
+        "latitude": 31.2304,
+        "longitude": 121.4737,
+    }
+
+
+@pytest.fixture
+def sample_earthquake_feature():
+    return {
+        "properties": {
+            "mag": 6.2,
+            "place": "near Taiwan",
+            "status": "reviewed",
+            "time": 1700000000000,
+        },
+        "geometry": {"coordinates": [121.5, 24.0, 15.0]},
+    }
+
+
+@pytest.fixture
+def sample_news_article():
+    return {
+        "source": {"name": "Reuters"},
+        "title": "Major port closure disrupts supply chain",
+        "description": "Shipping delays expected at the port of Rotterdam",
+        "content": "Logistics operators report cargo backlogs...",
+        "url": "https://example.com/article-1",
+        "publishedAt": "2024-01-01T00:00:00Z",
+    }
@@ -0,0 +1,48 @@
+from unittest.mock import Mock, patch
+
+from src.services.disaster.earthquake_service import EarthquakeService
+
+
+class TestEarthquakeService:
+
+    def setup_method(self):
+        self.service = EarthquakeService()
+
+    def test_get_affected_region_inside_bbox(self):
+        assert self.service._get_affected_region(34.0, -118.2) == "US West Coast"
+        assert self.service._get_affected_region(31.2, 121.5) == "East Asia"
+
+    def test_get_affected_region_outside_bbox(self):
+        assert self.service._get_affected_region(-60.0, 0.0) is None
+
+    def test_calculate_severity(self):
+        assert self.service._calculate_severity(7.5, None) == "critical"
+        assert self.service._calculate_severity(6.5, "East Asia") == "critical"
+        assert self.service._calculate_severity(6.5, None) == "warning"
+        assert self.service._calculate_severity(5.2, None) == "warning"
+        assert self.service._calculate_severity(4.6, None) == "watch"
+
+    def test_calculate_confidence(self):
+        reviewed = {"mag": 6.5, "status": "reviewed"}
+        assert self.service._calculate_confidence(reviewed, 10.0) == 1.0
+        deep = {"mag": 4.8, "status": "automatic"}
+        assert self.service._calculate_confidence(deep, 200.0) == 0.6
+
+    @patch("src.services.disaster.earthquake_service.requests.Session.get")
+    def test_get_earthquake_alerts(self, mock_get, sample_earthquake_feature):
+        mock_response = Mock()
+        mock_response.json.return_value = {"features": [sample_earthquake_feature]}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        alerts = self.service.get_earthquake_alerts()
+
+        assert len(alerts) == 1
+        assert alerts[0]["affected_region"] == "East Asia"
+        assert alerts[0]["severity"] == "critical"
+        assert alerts[0]["magnitude"] == 6.2
+
+    @patch("src.services.disaster.earthquake_service.requests.Session.get")
+    def test_get_earthquake_alerts_handles_errors(self, mock_get):
+        mock_get.side_effect = Exception("network down")
+        assert self.service.get_earthquake_alerts() == []
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import orjson
+
+from src.services.news.news_service import NewsService
+
+
+class _FakeResponse:
+    """Async context manager standing in for an aiohttp response."""
+
+    def __init__(self, payload):
+        self._body = orjson.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _mock_session_get(payload):
+    return patch(
+        "src.services.news.news_service.aiohttp.ClientSession.get",
+        return_value=_FakeResponse(payload),
+    )
+
+
+class TestNewsService:
+
+    def setup_method(self):
+        self.service = NewsService()
+
+    def _hits(self, article):
+        """Scan an article the way _classify does."""
+        text = (
+            f"{article.get('title', '')} {article.get('description', '') or ''} "
+            f"{article.get('content', '') or ''}"
+        ).lower()
+        return self.service._scan(text)
+
+    def test_classify_filters_irrelevant_articles(self, sample_news_article):
+        assert self.service._classify(sample_news_article) is not None
+        assert self.service._classify({
+            "title": "Local bake sale",
+            "description": "Cookies were sold",
+            "content": "",
+        }) is None
+
+    def test_analyze_severity(self, sample_news_article):
+        assert self.service._analyze_severity(
+            self._hits(sample_news_article)
+        ) == "critical"
+        assert self.service._analyze_severity(self._hits({
+            "title": "Shipping delays reported",
+            "description": "congestion at terminals",
+            "content": "",
+        })) == "warning"
+
+    def test_extract_location(self, sample_news_article):
+        assert self.service._extract_location(
+            self._hits(sample_news_article)
+        ) == "Rotterdam"
+        assert self.service._extract_location(self._hits({
+            "title": "Trade news",
+            "description": "no location here",
+            "content": "",
+        })) == "Global"
+
+    def test_calculate_confidence(self, sample_news_article):
+        confidence = self.service._calculate_confidence(
+            sample_news_article, self._hits(sample_news_article)
+        )
+        assert 0.0 <= confidence <= 1.0
+        assert confidence >= 0.7  # reliable source + hub + high impact
+
+    async def test_get_supply_chain_news_deduplicates(self, sample_news_article):
+        with _mock_session_get({"articles": [sample_news_article]}):
+            articles = await self.service.get_supply_chain_news()
+
+        # Same article returned for every keyword query; must dedupe to one
+        assert len(articles) == 1
+        assert articles[0].location == "Rotterdam"
@@ -0,0 +1,33 @@
+from config.settings import settings
+from src.models.disruption import DisruptionEvent
+from src.pipeline.pathway_rag_pipeline import SupplyChainPipeline
+
+
+class TestDisruptionPersistence:
+
+    def test_flush_writes_buffered_disruptions(self, test_db, temp_data_dir,
+                                               monkeypatch,
+                                               sample_weather_alert):
+        """Buffered disruptions land in the database on flush."""
+        monkeypatch.setattr(settings, "data_dir", temp_data_dir)
+        pipeline = SupplyChainPipeline()
+
+        pipeline._store_disruption(
+            sample_weather_alert,
+            {"disruption_type": "weather", "disruption_score": 0.7},
+            {"impact_score": 0.6, "affected_routes": [],
+             "mitigation_strategies": [], "financial_impact": {}},
+            priority_rank=40,
+        )
+        pipeline._flush_disruptions()
+
+        session = test_db()
+        try:
+            stored = session.query(DisruptionEvent).filter_by(
+                title=sample_weather_alert["title"]
+            ).all()
+            assert len(stored) == 1
+            assert stored[0].priority_rank == 40
+            assert stored[0].severity == sample_weather_alert["severity"]
+        finally:
+            session.close()
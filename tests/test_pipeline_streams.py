@@ -0,0 +1,20 @@
+from config.settings import settings
+from src.pipeline.pathway_rag_pipeline import SupplyChainPipeline
+
+
+class TestStreamConstruction:
+
+    def test_create_file_streams_with_configured_format(self, temp_data_dir,
+                                                        monkeypatch):
+        """Graph construction validates the reader format.
+
+        pw.io.fs.read rejects unsupported formats at build time, so a
+        stream_format the connector cannot read fails here instead of
+        at deployment.
+        """
+        monkeypatch.setattr(settings, "data_dir", temp_data_dir)
+        pipeline = SupplyChainPipeline()
+
+        pipeline._create_weather_stream()
+        pipeline._create_news_stream()
+        pipeline._create_earthquake_stream()
@@ -0,0 +1,33 @@
+from src.pipeline.pathway_rag_pipeline import PathwayQueryInterface
+
+
+class TestPathwayQueryInterface:
+
+    async def test_query_combines_retrieval_and_insights(
+            self, mock_pathway_pipeline, mock_vector_store, mock_ai_service):
+        interface = PathwayQueryInterface(mock_pathway_pipeline)
+
+        result = await interface.query("What is disrupting Rotterdam?")
+
+        mock_vector_store.search_real_time.assert_called_once_with(
+            "What is disrupting Rotterdam?", k=5
+        )
+        assert result["results"][0]["metadata"]["type"] == "port_info"
+        assert result["insights"] == "Mock insights"
+        assert result["index_size"] == 10
+
+    async def test_query_degrades_when_insights_fail(
+            self, mock_pathway_pipeline, mock_vector_store, mock_ai_service):
+        interface = PathwayQueryInterface(mock_pathway_pipeline)
+        mock_ai_service.generate_insights.side_effect = RuntimeError("api down")
+        try:
+            result = await interface.query("Current port status?")
+        finally:
+            # The AI service mock is session-scoped; put its canned
+            # answer back for other tests.
+            mock_ai_service.generate_insights.side_effect = None
+
+        assert result["insights"] == (
+            "Insights unavailable - see raw retrieval results."
+        )
+        assert result["results"]
@@ -0,0 +1,42 @@
+from src.pipeline.real_time_vector_store import RealTimeVectorStore
+
+
+class TestRealTimeVectorStore:
+
+    def test_streaming_add_keeps_columns_aligned(self, mock_sentence_transformer,
+                                                 mock_faiss_index):
+        """A batch insert extends every parallel column by the same amount."""
+        store = RealTimeVectorStore()
+        seeded = len(store.documents)
+
+        ids = store.add_documents_streaming(
+            ["Port of Rotterdam reports crane outages."],
+            [{"type": "port_info", "location": "Rotterdam"}],
+        )
+
+        assert ids == [seeded]
+        assert len(store.documents) == len(store.metadata) == len(store._doc_types)
+        assert store.metadata[ids[0]]["doc_id"] == ids[0]
+        assert "added_ms" in store.metadata[ids[0]]
+        assert mock_faiss_index.add.called
+
+    def test_recent_updates_are_nondestructive(self, mock_sentence_transformer,
+                                               mock_faiss_index):
+        """Window queries must not consume entries wider queries need."""
+        store = RealTimeVectorStore()
+        store.add_documents_streaming(
+            ["Thunderstorm closes terminal gates."],
+            [{"type": "weather", "location": "Shanghai"}],
+        )
+
+        before = store._count_recent_updates(minutes=60)
+        assert before > 0
+
+        recent = store.get_recent_updates(minutes=60)
+        assert len(recent) == before
+        assert all("added_ms" in metadata for metadata in recent)
+
+        # An empty window answered first must leave the hour-wide
+        # window intact.
+        assert store.get_recent_updates(minutes=0) == []
+        assert store._count_recent_updates(minutes=60) == before
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from src.services.weather.weather_service import WeatherService
+
+
+class _FakeResponse:
+    """Minimal stand-in for an httpx response."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def _mock_client_get(payload):
+    async def _get(self, *args, **kwargs):
+        return _FakeResponse(payload)
+
+    return patch(
+        "src.services.weather.weather_service.httpx.AsyncClient.get", _get
+    )
+
+
+class TestWeatherService:
+
+    def setup_method(self):
+        self.service = WeatherService()
+
+    def test_is_severe_weather(self):
+        assert self.service._is_severe_weather(
+            {"main": "Thunderstorm", "description": "heavy thunderstorm"}
+        )
+        assert not self.service._is_severe_weather(
+            {"main": "Clear", "description": "clear sky"}
+        )
+
+    def test_map_weather_severity(self):
+        assert self.service._map_weather_severity(
+            {"main": "Tornado", "description": "tornado"}
+        ) == "critical"
+        assert self.service._map_weather_severity(
+            {"main": "Thunderstorm", "description": "thunderstorm"}
+        ) == "warning"
+        assert self.service._map_weather_severity(
+            {"main": "Squall", "description": "squalls"}
+        ) == "warning"
+
+    def test_get_weather_alerts(self):
+        payload = {
+            "weather": [{"main": "Thunderstorm", "description": "heavy thunderstorm"}],
+            "wind": {"speed": 20.5},
+        }
+        with _mock_client_get(payload):
+            alerts = self.service.get_weather_alerts()
+
+        assert len(alerts) == len(self.service.key_locations)
+        assert all(a["source"] == "weather" for a in alerts)
+        assert all(a["severity"] in ("critical", "warning", "watch") for a in alerts)
+
+    def test_get_weather_alerts_skips_calm_conditions(self):
+        payload = {
+            "weather": [{"main": "Clear", "description": "clear sky"}],
+            "wind": {"speed": 3.0},
+        }
+        with _mock_client_get(payload):
+            assert self.service.get_weather_alerts() == []